@@ -3,16 +3,33 @@ from __future__ import annotations
 import asyncio
 import builtins
 import inspect
-from collections.abc import Callable, Iterable, Mapping, Sequence
+from collections.abc import Awaitable, Callable, Collection, Iterable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
 from contextvars import ContextVar
-from os import urandom
-from typing import TYPE_CHECKING, Any, Literal, NamedTuple, TypeVar, get_args, get_origin, get_type_hints, overload
-
-from ._service import Service
+from enum import IntEnum
+from functools import partial
+from itertools import count
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ForwardRef,
+    Literal,
+    NamedTuple,
+    TypeVar,
+    get_args,
+    get_origin,
+    get_type_hints,
+    overload,
+)
+
+from ._service import Service, ServiceState
 from ._utils import MISSING, _get_optional_type
 
 if TYPE_CHECKING:
-    from typing_extensions import Self
+    from typing_extensions import Self, TypeAlias
+
+    _Scope: TypeAlias = "dict[type[Any], Any]"
+    _Getter: TypeAlias = "Callable[[_Scope | None], Any]"
 
 __all__ = ("Application",)
 
@@ -20,28 +37,81 @@ T = TypeVar("T")
 T_SVC = TypeVar("T_SVC", bound=Service)
 
 
+class _Lifetime(IntEnum):
+    # Ordered by resolution priority, lowest first.
+    SINGLETON = 0
+    TRANSIENT = 1
+    SCOPED = 2
+    SERVICE = 3
+
+
+class _Constant(NamedTuple):
+    value: Any
+
+
 class _Dependency(NamedTuple):
-    name: str | None
-    type: type | Sequence[type]
+    name: str
+    type: tuple[type, ...]
     required: bool
     multiple: bool
 
 
-def _get_dependencies(cls: type) -> Sequence[_Dependency]:
+class _Dependencies(NamedTuple):
+    positional: Sequence[_Dependency]
+    keyword: Sequence[_Dependency]
+
+
+_DEPENDENCY_CACHE: dict[type, _Dependencies] = {}
+
+# Common origins of annotations requesting multiple dependencies, checked before falling back to issubclass.
+_MULTIPLE_ORIGINS: frozenset[Any] = frozenset((list, tuple, set, frozenset, Iterable, Sequence, Collection))
+
+# Only used to give each application's context variable a distinct name for debugging.
+_context_ids = count()
+
+
+def _get_dependencies(cls: type) -> _Dependencies:
     """Get the dependencies of a class.
 
+    The result is cached per class, as inspecting the signature and type hints of ``__init__`` is expensive.
+
     Parameters
     ----------
     cls: :class:`type`
         The class to get the dependencies of.
     """
+    cached = _DEPENDENCY_CACHE.get(cls)
+    if cached is not None:
+        return cached
+
+    dependencies = _inspect_dependencies(cls)
+    _DEPENDENCY_CACHE[cls] = dependencies
+    return dependencies
+
+
+def _needs_type_hints(annotation: Any) -> bool:
+    # Forward references can also be nested in generic aliases, e.g. ``Optional["Foo"]`` or ``list["Foo"]``.
+    if isinstance(annotation, (str, ForwardRef)):
+        return True
+    # get_type_hints strips the metadata from ``Annotated``, which is otherwise returned as part of its arguments.
+    if hasattr(annotation, "__metadata__"):
+        return True
+    return any(_needs_type_hints(arg) for arg in get_args(annotation))
+
+
+def _inspect_dependencies(cls: type) -> _Dependencies:
     if cls.__init__ is object.__init__:
-        return []
+        return _Dependencies((), ())
+
+    # get_type_hints is only needed to evaluate forward references and strip Annotated metadata
+    annotations = getattr(cls.__init__, "__annotations__", {})
+    if any(_needs_type_hints(annotation) for annotation in annotations.values()):
+        annotations = get_type_hints(cls.__init__)
 
-    annotations = get_type_hints(cls.__init__)
     signature = inspect.signature(cls.__init__)
 
-    dependencies = []
+    positional = []
+    keyword = []
 
     parameters = iter(signature.parameters.values())
     next(parameters)  # Skip self
@@ -51,39 +121,124 @@ def _get_dependencies(cls: type) -> Sequence[_Dependency]:
             raise ValueError(f"Missing type hint for parameter: {parameter}")
 
         optional, dependency = _get_optional_type(annotations[parameter.name])
+        # get_type_hints implicitly wraps annotations defaulting to None in Optional before Python 3.11,
+        # the raw annotations don't so a None default is treated as optional on every version.
+        if parameter.default is None:
+            optional = True
         multiple = False
 
         origin = get_origin(dependency)
         if origin is not None:
 
-            if issubclass(origin, Iterable):
+            if origin in _MULTIPLE_ORIGINS or (isinstance(origin, type) and issubclass(origin, Iterable)):
                 multiple = True
 
-            dependency = get_args(dependency)
+            types = get_args(dependency)
+        else:
+            types = (dependency,)
 
-        name = None
+        resolved = _Dependency(parameter.name, types, not optional, multiple)
         if parameter.kind is inspect.Parameter.KEYWORD_ONLY:
-            name = parameter.name
+            keyword.append(resolved)
+        else:
+            positional.append(resolved)
 
-        dependencies.append(_Dependency(name, dependency, not optional, multiple))
+    return _Dependencies(positional, keyword)
 
-    return dependencies
+
+def _compile_factory(
+    cls: type[T], args: Sequence[_Getter | _Constant], kwargs: Mapping[str, _Getter | _Constant]
+) -> Callable[[_Scope | None], T]:
+    """Generates a factory which calls each getter with the scope and passes the results to ``cls``.
+
+    The call is emitted as straight-line code, avoiding the per-call loops and
+    intermediate containers of a generic ``cls(*args, **kwargs)`` closure.
+    Constants are passed through as-is.
+    """
+    getters: dict[str, Any] = {"cls": cls}
+    arguments = []
+
+    for index, getter in enumerate(args):
+        if isinstance(getter, _Constant):
+            getters[f"arg{index}"] = getter.value
+            arguments.append(f"arg{index}")
+        else:
+            getters[f"arg{index}"] = getter
+            arguments.append(f"arg{index}(scope)")
+
+    for index, (name, getter) in enumerate(kwargs.items()):
+        if isinstance(getter, _Constant):
+            getters[f"kwarg{index}"] = getter.value
+            arguments.append(f"{name}=kwarg{index}")
+        else:
+            getters[f"kwarg{index}"] = getter
+            arguments.append(f"{name}=kwarg{index}(scope)")
+
+    source = (
+        f"def __create_factory({', '.join(getters)}):\n"
+        f"    def factory(scope):\n"
+        f"        return cls({', '.join(arguments)})\n"
+        f"    return factory\n"
+    )
+
+    namespace: dict[str, Any] = {}
+    exec(compile(source, f"<malamar factory: {cls.__qualname__}>", "exec"), namespace)
+    return namespace["__create_factory"](**getters)
+
+
+async def _wait_all(aws: Sequence[Awaitable[Any]], *, timeout: float | None, return_exceptions: bool = False) -> None:
+    if not aws:
+        return
+
+    # A lone awaitable is awaited directly to avoid allocating a gathering future.
+    if len(aws) == 1 and not return_exceptions:
+        awaitable = aws[0]
+    else:
+        awaitable = asyncio.gather(*aws, return_exceptions=return_exceptions)
+
+    if timeout is None:
+        await awaitable
+    else:
+        await asyncio.wait_for(awaitable, timeout)
+
+
+class _LazySingleton:
+    __slots__ = ("cls", "type", "materializing")
+
+    def __init__(self, cls: type, type: type) -> None:
+        self.cls: type = cls
+        self.type: type = type
+        self.materializing: bool = False
 
 
 class Application(Service):
     """The class responsible for managing the application and its services."""
 
+    __slots__ = (
+        "_singletons",
+        "_transients",
+        "_scoped",
+        "_contexts",
+        "_services",
+        "_lazy_services",
+        "_factories",
+        "_registry",
+    )
+
     def __init__(self):
         """Creates a new Application instance."""
         super().__init__()
 
-        self._singletons: dict[type[Any], Any | list[Any]] = {Application: self, type(self): self}
+        self._singletons: dict[type[Any], list[Any]] = {Application: [self], type(self): [self]}
         self._transients: dict[type[Any], type[Any]] = {}
         self._scoped: dict[type[Any], type[Any]] = {}
         self._contexts: ContextVar[dict[type[Any], Any]] = ContextVar(
-            f"malamar.{self.__class__.__name__}.{urandom(16).hex()}.context", default={}
+            f"malamar.{self.__class__.__name__}.{next(_context_ids)}.context"
         )
         self._services: dict[type[Service], Service] = {}
+        self._lazy_services: dict[type[Service], type[Service]] = {}
+        self._factories: dict[type[Any], Callable[[_Scope | None], Any]] = {}
+        self._registry: dict[type[Any], _Lifetime] = dict.fromkeys(self._singletons, _Lifetime.SINGLETON)
 
     async def start(self, *, timeout: float | None = None) -> None:
         """|coro|
@@ -100,12 +255,13 @@ class Application(Service):
         ------
         asyncio.TimeoutError
             A service did not start within the specified timeout.
+        ValueError
+            A required dependency of a registered class was not found, or registered classes depend on each other.
         """
-        coros = []
-        for service in self._services.values():
-            coros.append(service.start())
+        self._validate_graph()
 
-        await asyncio.gather(*coros)
+        coros = [service.start() for service in self._services.values() if service.state is ServiceState.STOPPED]
+        await _wait_all(coros, timeout=timeout)
 
     async def stop(self, *, timeout: float | None = None) -> None:
         """|coro|
@@ -115,76 +271,218 @@ class Application(Service):
         .. Warning::
 
             Exceptions raised by stopping services are discarded.
+
+        Parameters
+        ----------
+        timeout: Optional[:class:`float`]
+            The maximum number of seconds to allow for all services to stop.
+            If ``None``, no timeout is applied.
+
+        Raises
+        ------
+        asyncio.TimeoutError
+            A service did not stop within the specified timeout.
         """
-        coros = []
-        for service in self._services.values():
-            coros.append(service.stop())
+        coros = [service.stop() for service in self._services.values() if service.state is ServiceState.STARTED]
+        await _wait_all(coros, timeout=timeout, return_exceptions=True)
+
+    def _validate_graph(self) -> None:
+        classes = [*self._transients.values(), *self._scoped.values(), *self._lazy_services.values()]
+        for singletons in self._singletons.values():
+            classes.extend(singleton.cls for singleton in singletons if isinstance(singleton, _LazySingleton))
+
+        # Building the factories validates the graph, and they are then reused for instantiation.
+        for cls in classes:
+            self._get_factory(cls)
+
+        # The getters are only called on instantiation, so cycles between classes which are created on demand
+        # have to be found up front. Cycles through singletons are detected by _materialize_singleton instead.
+        visited: set[type] = set()
+        for cls in (*self._transients.values(), *self._scoped.values(), *self._lazy_services.values()):
+            self._check_cycles(cls, [], visited)
+
+    def _check_cycles(self, cls: type, path: list[type], visited: set[type]) -> None:
+        if cls in visited:
+            return
+
+        if cls in path:
+            cycle = [*path[path.index(cls) :], cls]
+            raise ValueError(f"Circular dependency detected: {' -> '.join(map(str, cycle))}")
+
+        path.append(cls)
+        dependencies = _get_dependencies(cls)
+        for dependency in (*dependencies.positional, *dependencies.keyword):
+            dependent = self._get_dependent_class(dependency)
+            if dependent is not None:
+                self._check_cycles(dependent, path, visited)
+        path.pop()
+
+        visited.add(cls)
+
+    def _get_dependent_class(self, dependency: _Dependency) -> type | None:
+        # Mirrors _resolve_parameter, returning the class instantiated on demand for the dependency, if any.
+        for type_ in dependency.type:
+            lifetime = self._registry.get(type_)
+            if lifetime is None:
+                continue
+
+            if lifetime is _Lifetime.TRANSIENT:
+                return self._transients[type_]
+            elif lifetime is _Lifetime.SCOPED:
+                return self._scoped[type_]
+            elif lifetime is _Lifetime.SERVICE:
+                return self._lazy_services.get(type_)
+            return None
 
-        await asyncio.gather(*coros)
+        return None
 
-    def _resolve_dependency(self, type: type, multiple: bool) -> Any | None:
-        dependency = None
-        if type in self._singletons:
+    def _register(self, type_: type, lifetime: _Lifetime) -> None:
+        current = self._registry.get(type_)
+        if current is None or lifetime < current:
+            self._registry[type_] = lifetime
+        self._factories.clear()
+
+    def _resolve_dependency(self, type_: type, multiple: bool) -> _Getter | _Constant | None:
+        lifetime = self._registry.get(type_)
+        if lifetime is None:
+            return None
+
+        if lifetime is _Lifetime.SINGLETON:
+            # Singletons which have already been created can't change without a new registration,
+            # which clears the factories, so their values can be captured directly.
+            singletons = self._singletons[type_]
             if multiple:
-                dependency = self.get_singletons(type)
-            else:
-                dependency = self.get_singleton(type)
-        elif type in self._transients:
-            dependency = self.get_transient(self._transients[type])
-        elif type in self._scoped:
-            dependency = self.get_scoped(type)
-        elif type in self._services:
-            dependency = self.get_service(type)
-
-        return dependency
-
-    def _resolve_dependencies(self, types: Sequence[_Dependency]) -> tuple[Sequence[Any], Mapping[str, Any]]:
-        dependencies = ([], {})
-        for dependency in types:
-            name, idk, required, multiple = dependency
-
-            resolved = None
-            if not isinstance(idk, Sequence):
-                idk = [idk]
-
-            for type in idk:
-                resolved = self._resolve_dependency(type, multiple=multiple)
-                if resolved is not None:
-                    break
-            else:
-                if required:
-                    raise ValueError(f"Required dependency not found: {dependency.type}")
+                if not any(isinstance(singleton, _LazySingleton) for singleton in singletons):
+                    return _Constant(singletons)
+            elif len(singletons) == 1 and not isinstance(singletons[0], _LazySingleton):
+                return _Constant(singletons[0])
 
-            if name is None:
-                dependencies[0].append(resolved)
-            else:
-                dependencies[1][name] = resolved
+            if multiple:
+                return lambda scope: self.get_singletons(type_)
+            return lambda scope: self.get_singleton(type_)
+        # The getters below run on every instantiation, so the lookups they need are bound up front.
+        # Classes registered under their own type can skip the instance check in _create_from_class.
+        elif lifetime is _Lifetime.TRANSIENT:
+            cls = self._transients[type_]
+            if cls is not type_:
+                return partial(self._get_transient, type_)
+
+            get_factory = self._get_factory
+            return lambda scope: get_factory(cls)(scope)
+        elif lifetime is _Lifetime.SCOPED:
+            cls = self._scoped[type_]
+            if cls is not type_:
+                return partial(self._get_scoped, type_)
+
+            get_factory = self._get_factory
+            get_scope = self._get_scope
+
+            def get_scoped(scope: _Scope | None) -> Any:
+                if scope is None:
+                    scope = get_scope()
+
+                instance = scope.get(type_, MISSING)
+                if instance is MISSING:
+                    instance = scope[type_] = get_factory(cls)(scope)
+                return instance
+
+            return get_scoped
+
+        # Like singletons, services which have already been created can be captured directly.
+        service = self._services.get(type_)
+        if service is not None:
+            return _Constant(service)
+        return lambda scope: self.get_service(type_)
+
+    def _resolve_parameter(self, dependency: _Dependency) -> _Getter | _Constant:
+        _, types, required, multiple = dependency
+
+        for type_ in types:
+            resolved = self._resolve_dependency(type_, multiple=multiple)
+            if resolved is not None:
+                return resolved
+
+        if required:
+            raise ValueError(f"Required dependency not found: {' | '.join(map(str, types))}")
+        return _Constant(None)
+
+    def _resolve_dependencies(
+        self, dependencies: _Dependencies
+    ) -> tuple[Sequence[_Getter | _Constant], Mapping[str, _Getter | _Constant]]:
+        args = [self._resolve_parameter(dependency) for dependency in dependencies.positional]
+
+        if not dependencies.keyword:
+            return args, {}
+
+        kwargs = {dependency.name: self._resolve_parameter(dependency) for dependency in dependencies.keyword}
+        return args, kwargs
+
+    def _build_factory(self, cls: type[T]) -> Callable[[_Scope | None], T]:
+        args, kwargs = self._resolve_dependencies(_get_dependencies(cls))
+        return _compile_factory(cls, args, kwargs)
+
+    def _get_factory(self, cls: type[T]) -> Callable[[_Scope | None], T]:
+        factory = self._factories.get(cls)
+        if factory is None:
+            factory = self._factories[cls] = self._build_factory(cls)
+        return factory
+
+    def _materialize_singleton(self, singleton: _LazySingleton) -> Any:
+        if singleton.materializing:
+            raise ValueError(f"Circular dependency detected while creating singleton: {singleton.type}")
+
+        singleton.materializing = True
+        try:
+            instance, _ = self._create_from_class(singleton.cls, type_=singleton.type)
+        finally:
+            singleton.materializing = False
 
-        return dependencies
+        # Allow factories to capture the new instance.
+        self._factories.clear()
 
-    def _create_instance(
-        self, cls: type[T] | T, *, type: type[T] | None = None, base: type[Any] | None = None
+        return instance
+
+    def _create_from_class(
+        self,
+        cls: type[T],
+        *,
+        type_: type[T] | None = None,
+        base: type[Any] | None = None,
+        scope: _Scope | None = None,
     ) -> tuple[T, type[T]]:
-        if type is None:
-            if not isinstance(cls, builtins.type):
-                raise ValueError("type must be provided for singleton instances")
-            type = cls
+        if type_ is None:
+            type_ = cls
 
         if base is not None:
-            if not issubclass(type, base):
-                raise ValueError(f"Type {type} must be a subclass of {base}")
+            if not issubclass(type_, base):
+                raise ValueError(f"Type {type_} must be a subclass of {base}")
 
-        if isinstance(cls, builtins.type):
-            dependancies = _get_dependencies(cls)
-            args, kwargs = self._resolve_dependencies(dependancies)
-            instance = cls(*args, **kwargs)
-        else:
-            instance = cls
+        # The scope is only created once a scoped getter needs it, creating it here would set it in
+        # the current context and share it with every task created from that context afterwards.
+        if scope is None:
+            scope = self._contexts.get(None)
+
+        instance = self._get_factory(cls)(scope)
 
-        if not isinstance(instance, type):
-            raise ValueError(f"Type {cls} is not a subclass of {type}")
+        if type_ is not cls and not isinstance(instance, type_):
+            raise ValueError(f"Type {cls} is not a subclass of {type_}")
 
-        return instance, type  # type: ignore  # I've got no idea what the type-checker is thinking
+        return instance, type_
+
+    def _create_from_instance(
+        self, instance: T, *, type_: type[T] | None = None, base: type[Any] | None = None
+    ) -> tuple[T, type[T]]:
+        if type_ is None:
+            raise ValueError("type must be provided for singleton instances")
+
+        if base is not None:
+            if not issubclass(type_, base):
+                raise ValueError(f"Type {type_} must be a subclass of {base}")
+
+        if not isinstance(instance, type_):
+            raise ValueError(f"Type {instance} is not a subclass of {type_}")
+
+        return instance, type_
 
     @overload
     def add_singleton(self, cls: type[T], /, *, type: type[T] | None = ...) -> Self: ...
@@ -201,15 +499,23 @@ class Application(Service):
             The singleton class or instance to add.
         type: Optional[:class:`type`]
             The type of the singleton. If not provided, the type of the class is used.
+
+        .. note::
+
+            Singleton classes are not instantiated until they are first retrieved.
         """
-        instance, type = self._create_instance(cls, type=type)
-        if type in self._singletons:
-            if isinstance(self._singletons[type], list):
-                self._singletons[type].append(instance)
-            else:
-                self._singletons[type] = [self._singletons[type], instance]
+        # Checking the exact metaclass first avoids the isinstance call for most classes.
+        if builtins.type(cls) is builtins.type or isinstance(cls, builtins.type):
+            if type is None:
+                type = cls
+            elif not issubclass(cls, type):
+                raise ValueError(f"Type {cls} is not a subclass of {type}")
+            instance = _LazySingleton(cls, type)
         else:
-            self._singletons[type] = instance
+            instance, type = self._create_from_instance(cls, type_=type)
+
+        self._singletons.setdefault(type, []).append(instance)
+        self._register(type, _Lifetime.SINGLETON)
         return self
 
     def add_transient(self, cls: type, *, type: type | None = None) -> Self:
@@ -228,8 +534,8 @@ class Application(Service):
         if type in self._transients:
             raise ValueError(f"Transient already exists: {type}")
 
-        self._resolve_dependencies(_get_dependencies(cls))
         self._transients[type] = cls
+        self._register(type, _Lifetime.TRANSIENT)
         return self
 
     def add_scoped(self, cls: type, *, type: type | None = None) -> Self:
@@ -248,11 +554,11 @@ class Application(Service):
         if type in self._scoped:
             raise ValueError(f"Scoped already exists: {type}")
 
-        self._resolve_dependencies(_get_dependencies(cls))
         self._scoped[type] = cls
+        self._register(type, _Lifetime.SCOPED)
         return self
 
-    def add_service(self, cls: type[T_SVC] | T_SVC, *, type: type[T_SVC] | None = None) -> Self:
+    def add_service(self, cls: type[T_SVC] | T_SVC, *, type: type[T_SVC] | None = None, lazy: bool = False) -> Self:
         """Adds a service to the application.
 
         Parameters
@@ -261,135 +567,229 @@ class Application(Service):
             The service class to add.
         type: Optional[:class:`type`]
             The type of the service. If not provided, the type of the class is used.
+        lazy: :class:`bool`
+            Whether to defer instantiating the service until it is first retrieved.
+            Lazy services are not started by :meth:`start` until they have been instantiated,
+            use :meth:`start_service` to instantiate and start one on demand.
         """
-        instance, type = self._create_instance(cls, type=type, base=Service)
+        if isinstance(cls, builtins.type):
+            if lazy:
+                if type is None:
+                    type = cls
+                elif not issubclass(cls, type):
+                    raise ValueError(f"Type {cls} is not a subclass of {type}")
+                if not issubclass(type, Service):
+                    raise ValueError(f"Type {type} must be a subclass of {Service}")
+
+                self._lazy_services[type] = cls
+                self._register(type, _Lifetime.SERVICE)
+                return self
+
+            instance, type = self._create_from_class(cls, type_=type, base=Service)
+        elif lazy:
+            raise ValueError("Lazy services must be added as a class")
+        else:
+            instance, type = self._create_from_instance(cls, type_=type, base=Service)
+
         self._services[type] = instance
+        self._lazy_services.pop(type, None)
+        self._register(type, _Lifetime.SERVICE)
         # instance._register()
         return self
 
     @overload
-    def get_singleton(self, type: type[T], /, *, required: Literal[True]) -> T: ...
+    def get_singleton(self, type_: type[T], /, *, required: Literal[True]) -> T: ...
 
     @overload
-    def get_singleton(self, type: type[T], /, *, required: bool = ...) -> T | None: ...
+    def get_singleton(self, type_: type[T], /, *, required: bool = ...) -> T | None: ...
 
-    def get_singleton(self, type: type[T], /, *, required: bool = True) -> T | None:
+    def get_singleton(self, type_: type[T], /, *, required: bool = True) -> T | None:
         """Retrieves a singleton from the application.
 
         Parameters
         ----------
-        type: :class:`type`
+        type_: :class:`type`
             The type of the singleton to retrieve.
         """
-        if type not in self._singletons:
+        singletons = self._singletons.get(type_)
+        if singletons is None:
             if required:
-                raise ValueError(f"Singleton of type {type} not found")
+                raise ValueError(f"Singleton of type {type_} not found")
             return None
 
-        singleton = self._singletons[type]
+        if len(singletons) != 1:
+            raise ValueError(f"Multiple singletons of type {type_} found")
 
-        if isinstance(singleton, list):
-            raise ValueError(f"Multiple singletons of type {type} found")
+        singleton = singletons[0]
+        if isinstance(singleton, _LazySingleton):
+            singleton = singletons[0] = self._materialize_singleton(singleton)
 
         return singleton
 
     @overload
-    def get_singletons(self, type: type[T], /, *, required: Literal[True]) -> list[T]: ...
+    def get_singletons(self, type_: type[T], /, *, required: Literal[True]) -> list[T]: ...
 
     @overload
-    def get_singletons(self, type: type[T], /, *, required: bool = ...) -> list[T] | None: ...
+    def get_singletons(self, type_: type[T], /, *, required: bool = ...) -> list[T] | None: ...
 
-    def get_singletons(self, type: type[T], /, *, required: bool = True) -> list[T] | None:
+    def get_singletons(self, type_: type[T], /, *, required: bool = True) -> list[T] | None:
         """Retrieves all singletons of a type from the application.
 
         Parameters
         ----------
-        type: :class:`type`
+        type_: :class:`type`
             The type of the singletons to retrieve.
         """
-        if type not in self._singletons:
+        singletons = self._singletons.get(type_)
+        if singletons is None:
             if required:
-                raise ValueError(f"Singletons of type {type} not found")
+                raise ValueError(f"Singletons of type {type_} not found")
             return None
 
-        singletons = self._singletons[type]
-
-        if not isinstance(singletons, list):
-            singletons = [singletons]
+        for index, singleton in enumerate(singletons):
+            if isinstance(singleton, _LazySingleton):
+                singletons[index] = self._materialize_singleton(singleton)
 
         return singletons
 
     @overload
-    def get_transient(self, type: type[T], /, *, required: Literal[True]) -> T: ...
+    def get_transient(self, type_: type[T], /, *, required: Literal[True]) -> T: ...
 
     @overload
-    def get_transient(self, type: type[T], /, *, required: bool = ...) -> T | None: ...
+    def get_transient(self, type_: type[T], /, *, required: bool = ...) -> T | None: ...
 
-    def get_transient(self, type: type[T], /, *, required: bool = True) -> T | None:
+    def get_transient(self, type_: type[T], /, *, required: bool = True) -> T | None:
         """Retrieves a transient from the application.
 
         Parameters
         ----------
-        type: :class:`type`
+        type_: :class:`type`
             The type of the transient to retrieve.
         """
-        if type not in self._transients:
+        cls = self._transients.get(type_)
+        if cls is None:
             if required:
-                raise ValueError(f"Transient not found: {type}")
+                raise ValueError(f"Transient not found: {type_}")
             return None
 
-        instance, _ = self._create_instance(self._transients[type], type=type)
+        instance, _ = self._create_from_class(cls, type_=type_)
+        return instance
+
+    def _get_transient(self, type_: type[T], scope: _Scope | None) -> T:
+        instance, _ = self._create_from_class(self._transients[type_], type_=type_, scope=scope)
         return instance
 
     @overload
-    def get_scoped(self, type: type[T], /, *, required: Literal[True]) -> T: ...
+    def get_scoped(self, type_: type[T], /, *, required: Literal[True]) -> T: ...
 
     @overload
-    def get_scoped(self, type: type[T], /, *, required: bool = ...) -> T | None: ...
+    def get_scoped(self, type_: type[T], /, *, required: bool = ...) -> T | None: ...
 
-    def get_scoped(self, type: type[T], /, *, required: bool = True) -> T | None:
+    def get_scoped(self, type_: type[T], /, *, required: bool = True) -> T | None:
         """Retrieves a scoped from the application.
 
         Parameters
         ----------
-        type: :class:`type`
+        type_: :class:`type`
             The type of the scoped to retrieve.
         """
-        if type not in self._scoped:
+        cls = self._scoped.get(type_)
+        if cls is None:
             if required:
-                raise ValueError(f"Scoped not found: {type}")
+                raise ValueError(f"Scoped not found: {type_}")
             return None
 
-        context = self._contexts.get()
+        scope = self._get_scope()
+        instance = scope.get(type_, MISSING)
+        if instance is MISSING:
+            instance, _ = self._create_from_class(cls, type_=type_, scope=scope)
+            scope[type_] = instance
+
+        return instance
+
+    def _get_scope(self) -> _Scope:
+        scope = self._contexts.get(None)
+        if scope is None:
+            # Created per context rather than as the ContextVar default, which would be shared by every context.
+            scope = {}
+            self._contexts.set(scope)
+        return scope
+
+    @contextmanager
+    def scope(self) -> Iterator[None]:
+        """Creates a new scope for scoped services.
+
+        Scoped services retrieved within the ``with`` block are created once and shared until the block exits.
+        Outside of an explicit scope, a scope is created for the current context on first use,
+        and is inherited by any :class:`asyncio.Task` created from it afterwards.
+        """
+        token = self._contexts.set({})
+        try:
+            yield
+        finally:
+            self._contexts.reset(token)
+
+    def _get_scoped(self, type_: type[T], scope: _Scope | None) -> T:
+        if scope is None:
+            scope = self._get_scope()
 
-        if type not in context:
-            instance, _ = self._create_instance(self._scoped[type], type=type)
-            context[type] = instance
+        instance = scope.get(type_, MISSING)
+        if instance is MISSING:
+            instance, _ = self._create_from_class(self._scoped[type_], type_=type_, scope=scope)
+            scope[type_] = instance
 
-        return context[type]
+        return instance
 
     @overload
-    def get_service(self, type: type[T_SVC], /, *, required: Literal[True]) -> T_SVC: ...
+    def get_service(self, type_: type[T_SVC], /, *, required: Literal[True]) -> T_SVC: ...
 
     @overload
-    def get_service(self, type: type[T_SVC], /, *, required: bool = ...) -> T_SVC | None: ...
+    def get_service(self, type_: type[T_SVC], /, *, required: bool = ...) -> T_SVC | None: ...
 
-    def get_service(self, type: type[T_SVC], /, *, required: bool = True) -> T_SVC | None:
+    def get_service(self, type_: type[T_SVC], /, *, required: bool = True) -> T_SVC | None:
         """Retrieves a service from the application.
 
         Parameters
         ----------
-        type: :class:`type`
+        type_: :class:`type`
             The type of the required service to retrieve.
         required: :class:`bool`
             Whether the service is required. If ``True``, an exception will be raised if the service is not found.
         """
-        if type not in self._services:
-            if required:
-                raise ValueError(f"Service not found: {type}")
-            return None
+        service = self._services.get(type_)
+        if service is None:
+            cls = self._lazy_services.get(type_)
+            if cls is None:
+                if required:
+                    raise ValueError(f"Service not found: {type_}")
+                return None
+
+            # The lazy registration is only removed once the service exists, so a failed construction can be retried.
+            service, _ = self._create_from_class(cls, type_=type_, base=Service)
+            self._services[type_] = service
+            self._lazy_services.pop(type_, None)
+
+        return service  # type: ignore  # type_ is used as the key for services of that type
+
+    async def start_service(self, type_: type[T_SVC], /, *, timeout: float | None = None) -> T_SVC:
+        """|coro|
+
+        Starts a single service, instantiating it first if it was added lazily.
 
-        return self._services[type]
+        If the service is already running, it is returned as is.
+
+        Parameters
+        ----------
+        type_: :class:`type`
+            The type of the service to start.
+        timeout: Optional[:class:`float`]
+            The maximum number of seconds to allow for the service to start.
+            If ``None``, no timeout is applied.
+        """
+        service = self.get_service(type_, required=True)
+        if service.state is ServiceState.STOPPED:
+            await service.start(timeout=timeout)
+        return service
 
     @overload
     def singleton(self, cls: type[T], /, type: type[T] = ...) -> type[T]: ...
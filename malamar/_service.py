@@ -49,40 +49,43 @@ async def _start_service(self: Service, *, timeout: float | None = None) -> None
     ------
     asyncio.TimeoutError
         A service did not start within the specified timeout.
+    RuntimeError
+        The service is already running or is stopping.
     """
-    if self._starting.is_set() or self._started.is_set():
+    # The state checks and the transition below run without yielding to the event loop,
+    # so concurrent calls cannot interleave here and no lock is required.
+    if self._state is ServiceState.STARTING or self._state is ServiceState.STARTED:
         raise RuntimeError("Application is already running")
-    elif self._stopping.is_set():  # Note: this shouldn't be possible
+    elif self._state is ServiceState.STOPPING:
         raise RuntimeError("Application is stopping")
 
-    self._starting.set()
+    self._set_state(ServiceState.STARTING)
 
     try:
         await self.__service_start__(timeout=timeout)
-    finally:
-        self._starting.clear()
+    except BaseException:
+        self._set_state(ServiceState.STOPPED)
+        raise
 
-    self._stopped.clear()
-    self._started.set()
+    self._set_state(ServiceState.STARTED)
 
 
 async def _stop_service(self: Service, *, timeout: float | None = None) -> None:
-    if not self._started.is_set():
-        raise RuntimeError("Application is not running")
-    elif self._stopping.is_set():
+    # See _start_service for why no lock is required.
+    if self._state is ServiceState.STOPPING:
         raise RuntimeError("Application is already stopping")
-    elif self._stopped.is_set():  # Note: this shouldn't be possible
-        raise RuntimeError("Application is already stopped")
+    elif self._state is not ServiceState.STARTED:
+        raise RuntimeError("Application is not running")
 
-    self._stopping.set()
+    self._set_state(ServiceState.STOPPING)
 
     try:
         await self.__service_stop__(timeout=timeout)
-    finally:
-        self._stopping.clear()
+    except BaseException:
+        self._set_state(ServiceState.STARTED)
+        raise
 
-    self._started.clear()
-    self._stopped.set()
+    self._set_state(ServiceState.STOPPED)
 
 
 class _ServiceMeta(ABCMeta):
@@ -114,22 +117,15 @@ class _ServiceMeta(ABCMeta):
 class Service(metaclass=_ServiceMeta):
     """Base class for services."""
 
-    # __registered: bool = False
-    # __running: bool = False
-
     def __init__(self):
         """Creates a new Service instance."""
-        print("Hello from Service", self)
-        self._starting: asyncio.Event = asyncio.Event()
-        self._started: asyncio.Event = asyncio.Event()
-        self._stopping: asyncio.Event = asyncio.Event()
-        self._stopped: asyncio.Event = asyncio.Event()
+        self._state: ServiceState = ServiceState.STOPPED
+        # Only allocated once something waits on a state, most services are never awaited.
+        self._state_waiters: dict[ServiceState, asyncio.Future[Literal[True]]] | None = None
 
         self.start = _bind_function(self, _start_service, name="start")
         self.stop = _bind_function(self, _stop_service, name="stop")
 
-        self._stopped.set()
-
     @abstractmethod
     async def start(self, *, timeout: float | None = None) -> None:
         """Called when the service is started, this method should be overridden to implement the service logic."""
@@ -140,19 +136,32 @@ class Service(metaclass=_ServiceMeta):
         """Called when the service is stopped, this method should be overridden to implement the service cleanup logic."""
         pass
 
+    def _set_state(self, state: ServiceState) -> None:
+        self._state = state
+
+        if self._state_waiters:
+            waiter = self._state_waiters.pop(state, None)
+            if waiter is not None and not waiter.done():
+                waiter.set_result(True)
+
+    async def _wait_for_state(self, state: ServiceState) -> Literal[True]:
+        if self._state is state:
+            return True
+
+        if self._state_waiters is None:
+            self._state_waiters = {}
+
+        waiter = self._state_waiters.get(state)
+        if waiter is None:
+            waiter = self._state_waiters[state] = asyncio.get_running_loop().create_future()
+
+        # Shielded so that a cancelled waiter does not cancel the future shared with other waiters.
+        return await asyncio.shield(waiter)
+
     @property
     def state(self) -> ServiceState:
         """The state of the application."""
-        if self._starting.is_set():
-            return ServiceState.STARTING
-        elif self._stopping.is_set():
-            return ServiceState.STOPPING
-        elif self._started.is_set():
-            return ServiceState.STARTED
-        elif self._stopped.is_set():
-            return ServiceState.STOPPED
-
-        return ServiceState.UNKNOWN
+        return self._state
 
     @property
     def starting(self) -> Awaitable[Literal[True]]:
@@ -160,7 +169,7 @@ class Service(metaclass=_ServiceMeta):
 
         An awaitable that resolves when the application is starting.
         """
-        return self._starting.wait()
+        return self._wait_for_state(ServiceState.STARTING)
 
     @property
     def started(self) -> Awaitable[Literal[True]]:
@@ -168,7 +177,7 @@ class Service(metaclass=_ServiceMeta):
 
         An awaitable that resolves when the application has started.
         """
-        return self._started.wait()
+        return self._wait_for_state(ServiceState.STARTED)
 
     @property
     def stopping(self) -> Awaitable[Literal[True]]:
@@ -176,7 +185,7 @@ class Service(metaclass=_ServiceMeta):
 
         An awaitable that resolves when the application is stopping.
         """
-        return self._stopping.wait()
+        return self._wait_for_state(ServiceState.STOPPING)
 
     @property
     def stopped(self) -> Awaitable[Literal[True]]:
@@ -184,4 +193,4 @@ class Service(metaclass=_ServiceMeta):
 
         An awaitable that resolves when the application has stopped.
         """
-        return self._stopped.wait()
+        return self._wait_for_state(ServiceState.STOPPED)
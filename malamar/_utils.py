@@ -24,6 +24,7 @@ R = TypeVar("R")
 
 
 _NoneType = type(None)
+_UnionType = getattr(types, "UnionType", None)
 
 
 class _MissingSentinel:
@@ -47,31 +48,19 @@ def _bind_function(instance: T, func: Callable[Concatenate[T, P], R], *, name: s
 
 
 def _get_optional_type(type: type[T | None]) -> tuple[Literal[True], T] | tuple[Literal[False], type[T | None]]:
-    if hasattr(typing, "Optional"):
-        if get_origin(type) is typing.Optional:
-            args = get_args(type)
-            if len(args) == 1:
-                return True, args[0]
-
-            return True, typing.Union.__getitem__(args)  # type: ignore
-
-    if hasattr(typing, "Union"):
-        args = get_args(type)
-        if get_origin(type) is typing.Union and _NoneType in args:
-            if len(args) == 2:
-                other = args[0] if args[1] is _NoneType else args[1]
-                return True, other
-
-            return True, typing.Union.__getitem__(t for t in args if t is not _NoneType)  # type: ignore
-
-    if hasattr(types, "UnionType"):
-        if getattr(type, "__class__", None) is types.UnionType:  # type: ignore
-            args = get_args(type)
-            if _NoneType in args:
-                if len(args) == 2:
-                    other = args[0] if args[1] is _NoneType else args[1]
-                    return True, other
-
-                return True, reduce(operator.or_, (t for t in args if t is not _NoneType))
-
-    return False, type
+    origin = get_origin(type)
+    if origin is not typing.Union and (_UnionType is None or origin is not _UnionType):
+        return False, type
+
+    args = get_args(type)
+    if _NoneType not in args:
+        return False, type
+
+    others = tuple(t for t in args if t is not _NoneType)
+    if len(others) == 1:
+        return True, others[0]
+
+    if origin is typing.Union:
+        return True, typing.Union[others]  # type: ignore
+
+    return True, reduce(operator.or_, others)